@@ -1,6 +1,6 @@
+import hashlib
 import logging
 from typing import Dict, Optional, Any, List
-import hyperliquid
 
 import eth_account
 from eth_account.signers.local import LocalAccount
@@ -8,6 +8,21 @@ from hyperliquid.exchange import Exchange
 from hyperliquid.info import Info
 from hyperliquid.utils import constants
 
+# Wallets derived from secret keys, keyed by a digest of the key so the
+# plaintext key is never held as a dict key
+_ACCOUNT_CACHE: Dict[bytes, LocalAccount] = {}
+
+
+def _get_account(secret_key: str) -> LocalAccount:
+    """Return the wallet for a secret key, deriving it only once per key"""
+    key_hash = hashlib.blake2b(secret_key.encode(), digest_size=16).digest()
+    account = _ACCOUNT_CACHE.get(key_hash)
+    if account is None:
+        account = eth_account.Account.from_key(secret_key)
+        _ACCOUNT_CACHE[key_hash] = account
+    return account
+
+
 class ApiConnector:
     """Handles connections to trading APIs and exchanges"""
     
@@ -36,7 +51,7 @@ class ApiConnector:
             api_url = constants.TESTNET_API_URL if use_testnet else constants.MAINNET_API_URL
             
             # Initialize wallet
-            self.wallet = eth_account.Account.from_key(secret_key)
+            self.wallet = _get_account(secret_key)
             
             # Initialize exchange and info
             self.exchange = Exchange(
@@ -49,10 +64,10 @@ class ApiConnector:
             # Test connection by getting balances
             user_state = self.info.user_state(self.wallet_address)
             
-            self.logger.info(f"Successfully connected to Hyperliquid {'(testnet)' if use_testnet else ''}")
+            self.logger.info("Successfully connected to Hyperliquid %s", "(testnet)" if use_testnet else "")
             return True
         except Exception as e:
-            self.logger.error(f"Error connecting to Hyperliquid: {str(e)}")
+            self.logger.error("Error connecting to Hyperliquid: %s", e)
             return False
     
     def get_balances(self) -> Dict[str, Any]:
@@ -68,11 +83,13 @@ class ApiConnector:
             # Format spot balances
             spot_balances = []
             for balance in spot_state.get("balances", []):
+                available = float(balance.get("available", 0))
+                total = float(balance.get("total", 0))
                 spot_balances.append({
                     "asset": balance.get("coin", ""),
-                    "available": float(balance.get("available", 0)),
-                    "total": float(balance.get("total", 0)),
-                    "in_orders": float(balance.get("total", 0)) - float(balance.get("available", 0))
+                    "available": available,
+                    "total": total,
+                    "in_orders": total - available
                 })
             
             # Format perpetual balances
@@ -88,7 +105,7 @@ class ApiConnector:
                 "perp": perp_balances
             }
         except Exception as e:
-            self.logger.error(f"Error fetching balances: {str(e)}")
+            self.logger.error("Error fetching balances: %s", e)
             return {"spot": [], "perp": {}}
     
     def get_positions(self) -> List[Dict[str, Any]]:
@@ -103,10 +120,11 @@ class ApiConnector:
             
             for asset_position in perp_state.get("assetPositions", []):
                 position = asset_position.get("position", {})
-                if float(position.get("szi", 0)) != 0:
+                size = float(position.get("szi", 0))
+                if size != 0:
                     positions.append({
                         "symbol": position.get("coin", ""),
-                        "size": float(position.get("szi", 0)),
+                        "size": size,
                         "entry_price": float(position.get("entryPx", 0)),
                         "mark_price": float(position.get("markPx", 0)),
                         "liquidation_price": float(position.get("liquidationPx", 0) or 0),
@@ -116,7 +134,7 @@ class ApiConnector:
             
             return positions
         except Exception as e:
-            self.logger.error(f"Error fetching positions: {str(e)}")
+            self.logger.error("Error fetching positions: %s", e)
             return []
     
     def get_market_data(self, symbol: str) -> Dict[str, Any]:
@@ -138,7 +156,7 @@ class ApiConnector:
                 "mid_price": float(mid_price)
             }
         except Exception as e:
-            self.logger.error(f"Error fetching market data: {str(e)}")
+            self.logger.error("Error fetching market data: %s", e)
             return {}
     
     def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -155,7 +173,7 @@ class ApiConnector:
             
             return open_orders
         except Exception as e:
-            self.logger.error(f"Error fetching open orders: {str(e)}")
+            self.logger.error("Error fetching open orders: %s", e)
             return []
     
     def get_trade_history(self, limit: int = 100) -> List[Dict[str, Any]]:
@@ -168,5 +186,5 @@ class ApiConnector:
             fills = self.info.user_fills(self.wallet_address)
             return fills[:limit]
         except Exception as e:
-            self.logger.error(f"Error fetching trade history: {str(e)}")
+            self.logger.error("Error fetching trade history: %s", e)
             return []
\ No newline at end of file
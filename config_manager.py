@@ -4,15 +4,15 @@ import hashlib
 import random
 import string
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 
 class ConfigManager:
     """Manages configuration settings for Elysium Trading Platform"""
     
     def __init__(self, config_file: str = "elysium_config.json"):
         self.config_file = config_file
-        self.config = self.load_config()
         self.logger = logging.getLogger(__name__)
+        self.config = self.load_config()
         
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file"""
@@ -22,7 +22,7 @@ class ConfigManager:
                     return json.load(f)
             return {}
         except Exception as e:
-            logging.error(f"Error loading config: {str(e)}")
+            self.logger.error("Error loading config: %s", e)
             return {}
     
     def save_config(self) -> bool:
@@ -32,7 +32,7 @@ class ConfigManager:
                 json.dump(self.config, f, indent=2)
             return True
         except Exception as e:
-            logging.error(f"Error saving config: {str(e)}")
+            self.logger.error("Error saving config: %s", e)
             return False
     
     def get(self, key: str, default: Any = None) -> Any:
@@ -68,7 +68,7 @@ class ConfigManager:
             self.config['salt'] = salt
             return self.save_config()
         except Exception as e:
-            self.logger.error(f"Error setting password: {str(e)}")
+            self.logger.error("Error setting password: %s", e)
             return False
     
     def verify_password(self, password: str) -> bool:
@@ -79,5 +79,5 @@ class ConfigManager:
                 return hashed == self.config['password_hash']
             return False
         except Exception as e:
-            self.logger.error(f"Error verifying password: {str(e)}")
+            self.logger.error("Error verifying password: %s", e)
             return False
\ No newline at end of file
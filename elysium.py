@@ -1,11 +1,8 @@
 #!/usr/bin/env python3
 
-import os
 import sys
 import logging
 import argparse
-import json
-from pathlib import Path
 
 # Import other modules
 from api_connector import ApiConnector
@@ -79,7 +76,7 @@ def main():
     except KeyboardInterrupt:
         logger.info("Shutting down due to keyboard interrupt")
     except Exception as e:
-        logger.error(f"Error in main: {e}", exc_info=True)
+        logger.error("Error in main: %s", e, exc_info=True)
     
     logger.info("Elysium Trading Platform shutdown complete")
 
@@ -2,7 +2,7 @@ import logging
 import threading
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List, Union, Any
+from typing import Dict, Optional, List, Any
 
 from hyperliquid.exchange import Exchange
 from hyperliquid.info import Info
@@ -10,11 +10,61 @@ from hyperliquid.info import Info
 class OrderHandler:
     """Handles all order execution for Elysium Trading Platform"""
     
+    # Asset metadata only changes on new listings, so a recent copy is reused
+    META_CACHE_TTL = 60.0
+    
     def __init__(self, exchange: Optional[Exchange], info: Optional[Info]):
         self.exchange = exchange
         self.info = info
         self.wallet_address = None
         self.logger = logging.getLogger(__name__)
+        
+        # Cached Info.meta() response and the Info object it was fetched from
+        self._meta_cache = None
+        self._meta_cache_info = None
+        self._meta_cache_time = 0.0
+        self._sz_decimals = {}  # szDecimals by asset name, rebuilt with each metadata fetch
+        self._meta_lock = threading.Lock()  # TWAP threads format orders concurrently
+        
+        # TWAP executions, managed by the methods attached from TwapExecution below
+        self.active_twaps = {}  # Dictionary to store active TWAP executions by ID
+        self.completed_twaps = {}  # Dictionary to store completed TWAP executions by ID
+        self.twap_id_counter = 1
+        self.twap_lock = threading.Lock()  # Lock for thread safety
+    
+    def _get_meta(self) -> Dict[str, Any]:
+        """
+        Get exchange metadata, reusing the last response for up to META_CACHE_TTL seconds
+        
+        Returns:
+            Metadata dictionary as returned by Info.meta()
+        """
+        with self._meta_lock:
+            now = time.monotonic()
+            if (self._meta_cache is None or self._meta_cache_info is not self.info
+                    or now - self._meta_cache_time > self.META_CACHE_TTL):
+                self._meta_cache = self.info.meta()
+                self._meta_cache_info = self.info
+                self._meta_cache_time = now
+                self._sz_decimals = {
+                    asset_info["name"]: asset_info.get("szDecimals", 8)
+                    for asset_info in self._meta_cache["universe"]
+                }
+            return self._meta_cache
+    
+    def _get_sz_decimals(self, symbol: str) -> Optional[int]:
+        """
+        Get the size decimals for a symbol from the cached metadata
+        
+        Args:
+            symbol: Trading pair symbol
+            
+        Returns:
+            Number of size decimals, or None if the symbol is not in the universe
+        """
+        self._get_meta()
+        return self._sz_decimals.get(symbol)
+    
     # =================================Spot Trading==============================================
     def market_buy(self, symbol: str, size: float, slippage: float = 0.05) -> Dict[str, Any]:
         """
@@ -32,19 +82,19 @@ class OrderHandler:
             return {"status": "error", "message": "Not connected to exchange"}
             
         try:
-            self.logger.info(f"Executing market buy: {size} {symbol}")
+            self.logger.info("Executing market buy: %s %s", size, symbol)
             result = self.exchange.market_open(symbol, True, size, None, slippage)
             
             if result["status"] == "ok":
                 for status in result["response"]["data"]["statuses"]:
                     if "filled" in status:
                         filled = status["filled"]
-                        self.logger.info(f"Market buy executed: {filled['totalSz']} @ {filled['avgPx']}")
+                        self.logger.info("Market buy executed: %s @ %s", filled['totalSz'], filled['avgPx'])
                     elif "error" in status:
-                        self.logger.error(f"Market buy error: {status['error']}")
+                        self.logger.error("Market buy error: %s", status['error'])
             return result
         except Exception as e:
-            self.logger.error(f"Error in market buy: {str(e)}")
+            self.logger.error("Error in market buy: %s", e)
             return {"status": "error", "message": str(e)}
         
     def _format_and_truncate(self, symbol: str, size: float, is_size: bool = True) -> str:
@@ -61,39 +111,40 @@ class OrderHandler:
             String representation with proper precision
         """
         try:
-            # Get the metadata for the symbol
-            meta = self.info.meta()
+            # Fast path: whole numbers (typical for UI-entered sizes) are already
+            # aligned for any precision, so skip the metadata lookup entirely
+            if size == int(size):
+                return str(int(size))
             
             # Default precision values
             decimals = 8 if is_size else 6
             
-            # Find the symbol's info and get specific precision
-            for asset_info in meta["universe"]:
-                if asset_info["name"] == symbol:
-                    if is_size:
-                        decimals = asset_info.get("szDecimals", 8)
-                    else:
-                        # For price, check if spot or perp
-                        coin = self.info.name_to_coin.get(symbol, symbol)
-                        if coin:
-                            asset_idx = self.info.coin_to_asset.get(coin)
-                            if asset_idx is not None:
-                                is_spot = asset_idx >= 10_000
-                                decimals = 8 if is_spot else 6
-                    break
+            # Look up the symbol's specific precision
+            sz_decimals = self._get_sz_decimals(symbol)
+            if sz_decimals is not None:
+                if is_size:
+                    decimals = sz_decimals
+                else:
+                    # For price, check if spot or perp
+                    coin = self.info.name_to_coin.get(symbol, symbol)
+                    if coin:
+                        asset_idx = self.info.coin_to_asset.get(coin)
+                        if asset_idx is not None:
+                            is_spot = asset_idx >= 10_000
+                            decimals = 8 if is_spot else 6
             
             # Format the number as string with proper precision, truncating any excess digits
             formatted = "{:.{}f}".format(size, decimals)
             
-            # Remove trailing zeros but keep at least one decimal place
+            # Remove trailing zeros and a dangling decimal point
             if '.' in formatted:
-                formatted = formatted.rstrip('0').rstrip('.') + ('0' if formatted.endswith('.0') else '')
+                formatted = formatted.rstrip('0').rstrip('.')
             
-            self.logger.debug(f"Formatted {'size' if is_size else 'price'}: {size} -> {formatted}")
+            self.logger.debug("Formatted %s: %s -> %s", 'size' if is_size else 'price', size, formatted)
             return formatted
             
         except Exception as e:
-            self.logger.warning(f"Error formatting value: {str(e)}. Using string conversion.")
+            self.logger.warning("Error formatting value: %s. Using string conversion.", e)
             return str(size)
             
     def market_sell(self, symbol: str, size: float, slippage: float = 0.05) -> Dict[str, Any]:
@@ -112,19 +163,19 @@ class OrderHandler:
             return {"status": "error", "message": "Not connected to exchange"}
             
         try:
-            self.logger.info(f"Executing market sell: {size} {symbol}")
+            self.logger.info("Executing market sell: %s %s", size, symbol)
             result = self.exchange.market_open(symbol, False, size, None, slippage)
             
             if result["status"] == "ok":
                 for status in result["response"]["data"]["statuses"]:
                     if "filled" in status:
                         filled = status["filled"]
-                        self.logger.info(f"Market sell executed: {filled['totalSz']} @ {filled['avgPx']}")
+                        self.logger.info("Market sell executed: %s @ %s", filled['totalSz'], filled['avgPx'])
                     elif "error" in status:
-                        self.logger.error(f"Market sell error: {status['error']}")
+                        self.logger.error("Market sell error: %s", status['error'])
             return result
         except Exception as e:
-            self.logger.error(f"Error in market sell: {str(e)}")
+            self.logger.error("Error in market sell: %s", e)
             return {"status": "error", "message": str(e)}
     
     def limit_buy(self, symbol: str, size: float, price: float) -> Dict[str, Any]:
@@ -147,7 +198,7 @@ class OrderHandler:
             size_str = self._format_and_truncate(symbol, size, is_size=True)
             price_str = self._format_and_truncate(symbol, price, is_size=False)
             
-            self.logger.info(f"Placing limit buy: {size_str} {symbol} @ {price_str}")
+            self.logger.info("Placing limit buy: %s %s @ %s", size_str, symbol, price_str)
             
             # Convert back to float for the API call but with the properly formatted precision
             size_float = float(size_str)
@@ -159,10 +210,10 @@ class OrderHandler:
                 status = result["response"]["data"]["statuses"][0]
                 if "resting" in status:
                     oid = status["resting"]["oid"]
-                    self.logger.info(f"Limit buy placed: order ID {oid}")
+                    self.logger.info("Limit buy placed: order ID %s", oid)
             return result
         except Exception as e:
-            self.logger.error(f"Error in limit buy: {str(e)}")
+            self.logger.error("Error in limit buy: %s", e)
             return {"status": "error", "message": str(e)}
     
     def limit_sell(self, symbol: str, size: float, price: float) -> Dict[str, Any]:
@@ -181,17 +232,17 @@ class OrderHandler:
             return {"status": "error", "message": "Not connected to exchange"}
             
         try:
-            self.logger.info(f"Placing limit sell: {size} {symbol} @ {price}")
+            self.logger.info("Placing limit sell: %s %s @ %s", size, symbol, price)
             result = self.exchange.order(symbol, False, size, price, {"limit": {"tif": "Gtc"}})
             
             if result["status"] == "ok":
                 status = result["response"]["data"]["statuses"][0]
                 if "resting" in status:
                     oid = status["resting"]["oid"]
-                    self.logger.info(f"Limit sell placed: order ID {oid}")
+                    self.logger.info("Limit sell placed: order ID %s", oid)
             return result
         except Exception as e:
-            self.logger.error(f"Error in limit sell: {str(e)}")
+            self.logger.error("Error in limit sell: %s", e)
             return {"status": "error", "message": str(e)}
         
     # =================================Scaled Orders==============================================
@@ -255,32 +306,22 @@ class OrderHandler:
             Properly formatted size
         """
         try:
-            # Get the metadata for the symbol
-            meta = self.info.meta()
-            
-            # Find the symbol's info
-            symbol_info = None
-            for asset_info in meta["universe"]:
-                if asset_info["name"] == symbol:
-                    symbol_info = asset_info
-                    break
-                
-            if symbol_info:
-                # Format size based on symbol's decimal places
-                sz_decimals = symbol_info.get("szDecimals", 8)  # Increase default decimals from 2 to 8
+            # Look up the symbol's size decimals
+            sz_decimals = self._get_sz_decimals(symbol)
                 
+            if sz_decimals is not None:
                 # Convert to string with proper precision and back to float to avoid float representation issues
                 size_str = f"{{:.{sz_decimals}f}}".format(size)
-                self.logger.debug(f"Formatting size: {size} -> {size_str}")
+                self.logger.debug("Formatting size: %s -> %s", size, size_str)
                 return float(size_str)
             
             # Default to 8 decimal places if symbol info not found
             size_str = f"{size:.8f}"
-            self.logger.debug(f"Formatting size (default): {size} -> {size_str}")
+            self.logger.debug("Formatting size (default): %s -> %s", size, size_str)
             return float(size_str)
             
         except Exception as e:
-            self.logger.warning(f"Error formatting size: {str(e)}. Using original size.")
+            self.logger.warning("Error formatting size: %s. Using original size.", e)
             return size
         
     def _format_price(self, symbol: str, price: float) -> float:
@@ -298,7 +339,7 @@ class OrderHandler:
             # Special handling for very large prices to avoid precision errors
             if price > 100_000:
                 price_str = f"{price:.0f}"
-                self.logger.debug(f"Formatting large price: {price} -> {price_str}")
+                self.logger.debug("Formatting large price: %s -> %s", price, price_str)
                 return float(price_str)
                 
             # Get precision based on symbol
@@ -313,11 +354,11 @@ class OrderHandler:
             
             # Format to string with proper precision and back to float
             price_str = f"{{:.{max_decimals}f}}".format(price)
-            self.logger.debug(f"Formatting price: {price} -> {price_str}")
+            self.logger.debug("Formatting price: %s -> %s", price, price_str)
             return float(price_str)
             
         except Exception as e:
-            self.logger.warning(f"Error formatting price: {str(e)}. Using original price.")
+            self.logger.warning("Error formatting price: %s. Using original price.", e)
             return price
 # ===================================== Scaled orders===========================================
     def scaled_orders(self, symbol: str, is_buy: bool, total_size: float, num_orders: int,
@@ -384,78 +425,77 @@ class OrderHandler:
                             best_bid = float(bid_levels[0]["px"])
                             best_ask = float(ask_levels[0]["px"])
                             
-                            self.logger.info(f"Current market for {symbol}: Bid: {best_bid}, Ask: {best_ask}")
+                            self.logger.info("Current market for %s: Bid: %s, Ask: %s", symbol, best_bid, best_ask)
                             
                             # For buy orders, ensure we're not buying above the ask
                             if is_buy:
-                                if start_price > best_ask * 1.05:  # Allow 5% above ask as maximum
-                                    self.logger.warning(f"Start price {start_price} is too high. Limiting to 5% above ask: {best_ask * 1.05}")
-                                    start_price = min(start_price, best_ask * 1.05)
+                                max_start = best_ask * 1.05  # Allow 5% above ask as maximum
+                                if start_price > max_start:
+                                    self.logger.warning("Start price %s is too high. Limiting to 5%% above ask: %s", start_price, max_start)
+                                    start_price = max_start
                                 
                                 # Make sure end price is not above best ask
                                 if end_price > best_ask:
-                                    self.logger.warning(f"End price {end_price} is above best ask. Setting to best bid.")
+                                    self.logger.warning("End price %s is above best ask. Setting to best bid.", end_price)
                                     end_price = best_bid
                                     
                             # For sell orders, ensure we're not selling below the bid
                             else:
-                                if start_price < best_bid * 0.95:  # Allow 5% below bid as minimum
-                                    self.logger.warning(f"Start price {start_price} is too low. Limiting to 5% below bid: {best_bid * 0.95}")
-                                    start_price = max(start_price, best_bid * 0.95)
+                                min_start = best_bid * 0.95  # Allow 5% below bid as minimum
+                                if start_price < min_start:
+                                    self.logger.warning("Start price %s is too low. Limiting to 5%% below bid: %s", start_price, min_start)
+                                    start_price = min_start
                                     
                                 # Make sure end price is not below best bid
                                 if end_price < best_bid:
-                                    self.logger.warning(f"End price {end_price} is below best bid. Setting to best ask.")
+                                    self.logger.warning("End price %s is below best bid. Setting to best ask.", end_price)
                                     end_price = best_ask
                 except Exception as e:
-                    self.logger.warning(f"Error checking market data: {str(e)}. Continuing with provided prices.")
+                    self.logger.warning("Error checking market data: %s. Continuing with provided prices.", e)
                     
             # Calculate size and price for each order
             order_sizes = self._calculate_order_distribution(total_size, num_orders, skew)
             price_levels = self._calculate_price_levels(is_buy, num_orders, start_price, end_price)
             
             # Format sizes and prices to avoid float_to_wire errors
-            formatted_sizes = []
-            formatted_prices = []
-
-            for i in range(num_orders):
-                size_str = self._format_and_truncate(symbol, order_sizes[i], is_size=True)
-                price_str = self._format_and_truncate(symbol, price_levels[i], is_size=False)
-                formatted_sizes.append(float(size_str))
-                formatted_prices.append(float(price_str))
+            format_value = self._format_and_truncate
+            formatted_sizes = [float(format_value(symbol, size, is_size=True)) for size in order_sizes]
+            formatted_prices = [float(format_value(symbol, price, is_size=False)) for price in price_levels]
             
             # Place orders
-            self.logger.info(f"Placing {num_orders} {'buy' if is_buy else 'sell'} orders for {symbol} from {start_price} to {end_price} with total size {total_size}")
+            self.logger.info("Placing %s %s orders for %s from %s to %s with total size %s", num_orders, 'buy' if is_buy else 'sell', symbol, start_price, end_price, total_size)
+            
+            order_requests = [
+                {
+                    "coin": symbol,
+                    "is_buy": is_buy,
+                    "sz": size,
+                    "limit_px": price,
+                    "order_type": order_type,
+                    "reduce_only": reduce_only
+                }
+                for size, price in zip(formatted_sizes, formatted_prices)
+            ]
             
             order_results = []
             successful_orders = 0
             
-            for i in range(num_orders):
-                try:
-                    result = self.exchange.order(
-                        symbol, 
-                        is_buy, 
-                        formatted_sizes[i], 
-                        formatted_prices[i], 
-                        order_type, 
-                        reduce_only
-                    )
-                    
-                    order_results.append(result)
-                    
-                    if result["status"] == "ok":
-                        successful_orders += 1
-                        self.logger.info(f"Order {i+1}/{num_orders} placed: {formatted_sizes[i]} @ {formatted_prices[i]}")
+            # Submit the whole ladder in one request instead of one round-trip (and sleep) per order
+            response = self.exchange.bulk_orders(order_requests)
+            
+            if response["status"] == "ok":
+                statuses = response["response"]["data"]["statuses"]
+                for i, status in enumerate(statuses):
+                    if isinstance(status, dict) and "error" in status:
+                        self.logger.error("Order %s/%s failed: %s", i+1, num_orders, status['error'])
+                        order_results.append({"status": "error", "message": status["error"]})
                     else:
-                        self.logger.error(f"Order {i+1}/{num_orders} failed: {result}")
-                        
-                    # Small delay to avoid rate limiting
-                    time.sleep(0.1)
-                    
-                except Exception as e:
-                    error_msg = f"Error placing order {i+1}/{num_orders}: {str(e)}"
-                    self.logger.error(error_msg)
-                    order_results.append({"status": "error", "message": error_msg})
+                        successful_orders += 1
+                        self.logger.info("Order %s/%s placed: %s @ %s", i+1, num_orders, formatted_sizes[i], formatted_prices[i])
+                        order_results.append({"status": "ok", "data": status})
+            else:
+                self.logger.error("Scaled orders failed: %s", response)
+                order_results.append(response)
             
             return {
                 "status": "ok" if successful_orders > 0 else "error",
@@ -467,7 +507,7 @@ class OrderHandler:
                 "prices": formatted_prices
             }
         except Exception as e:
-            self.logger.error(f"Error in scaled orders: {str(e)}")
+            self.logger.error("Error in scaled orders: %s", e)
             return {"status": "error", "message": str(e)}
 
     # Also, fix the _calculate_price_levels function to ensure the range is correct
@@ -533,7 +573,7 @@ class OrderHandler:
                 order_type, reduce_only
             )
         except Exception as e:
-            self.logger.error(f"Error in perpetual scaled orders: {str(e)}")
+            self.logger.error("Error in perpetual scaled orders: %s", e)
             return {"status": "error", "message": str(e)}
                 
 # =================================Perp Trading==============================================
@@ -557,19 +597,19 @@ class OrderHandler:
             # Set leverage first
             self._set_leverage(symbol, leverage)
             
-            self.logger.info(f"Executing perp market buy: {size} {symbol} with {leverage}x leverage")
+            self.logger.info("Executing perp market buy: %s %s with %sx leverage", size, symbol, leverage)
             result = self.exchange.market_open(symbol, True, size, None, slippage)
             
             if result["status"] == "ok":
                 for status in result["response"]["data"]["statuses"]:
                     if "filled" in status:
                         filled = status["filled"]
-                        self.logger.info(f"Perp market buy executed: {filled['totalSz']} @ {filled['avgPx']}")
+                        self.logger.info("Perp market buy executed: %s @ %s", filled['totalSz'], filled['avgPx'])
                     elif "error" in status:
-                        self.logger.error(f"Perp market buy error: {status['error']}")
+                        self.logger.error("Perp market buy error: %s", status['error'])
             return result
         except Exception as e:
-            self.logger.error(f"Error in perp market buy: {str(e)}")
+            self.logger.error("Error in perp market buy: %s", e)
             return {"status": "error", "message": str(e)}
         
     def perp_market_sell(self, symbol: str, size: float, leverage: int = 1, slippage: float = 0.05) -> Dict[str, Any]:
@@ -592,19 +632,19 @@ class OrderHandler:
             # Set leverage first
             self._set_leverage(symbol, leverage)
             
-            self.logger.info(f"Executing perp market sell: {size} {symbol} with {leverage}x leverage")
+            self.logger.info("Executing perp market sell: %s %s with %sx leverage", size, symbol, leverage)
             result = self.exchange.market_open(symbol, False, size, None, slippage)
             
             if result["status"] == "ok":
                 for status in result["response"]["data"]["statuses"]:
                     if "filled" in status:
                         filled = status["filled"]
-                        self.logger.info(f"Perp market sell executed: {filled['totalSz']} @ {filled['avgPx']}")
+                        self.logger.info("Perp market sell executed: %s @ %s", filled['totalSz'], filled['avgPx'])
                     elif "error" in status:
-                        self.logger.error(f"Perp market sell error: {status['error']}")
+                        self.logger.error("Perp market sell error: %s", status['error'])
             return result
         except Exception as e:
-            self.logger.error(f"Error in perp market sell: {str(e)}")
+            self.logger.error("Error in perp market sell: %s", e)
             return {"status": "error", "message": str(e)}
         
     def perp_limit_buy(self, symbol: str, size: float, price: float, leverage: int = 1) -> Dict[str, Any]:
@@ -631,7 +671,7 @@ class OrderHandler:
             size_str = self._format_and_truncate(symbol, size, is_size=True)
             price_str = self._format_and_truncate(symbol, price, is_size=False)
             
-            self.logger.info(f"Placing perp limit buy: {size_str} {symbol} @ {price_str} with {leverage}x leverage")
+            self.logger.info("Placing perp limit buy: %s %s @ %s with %sx leverage", size_str, symbol, price_str, leverage)
             
             # Convert back to float for the API call but with the properly formatted precision
             size_float = float(size_str)
@@ -643,10 +683,10 @@ class OrderHandler:
                 status = result["response"]["data"]["statuses"][0]
                 if "resting" in status:
                     oid = status["resting"]["oid"]
-                    self.logger.info(f"Perp limit buy placed: order ID {oid}")
+                    self.logger.info("Perp limit buy placed: order ID %s", oid)
             return result
         except Exception as e:
-            self.logger.error(f"Error in perp limit buy: {str(e)}")
+            self.logger.error("Error in perp limit buy: %s", e)
             return {"status": "error", "message": str(e)}
         
     
@@ -674,7 +714,7 @@ class OrderHandler:
             size_str = self._format_and_truncate(symbol, size, is_size=True)
             price_str = self._format_and_truncate(symbol, price, is_size=False)
             
-            self.logger.info(f"Placing perp limit sell: {size_str} {symbol} @ {price_str} with {leverage}x leverage")
+            self.logger.info("Placing perp limit sell: %s %s @ %s with %sx leverage", size_str, symbol, price_str, leverage)
             
             # Convert back to float for the API call but with the properly formatted precision
             size_float = float(size_str)
@@ -686,10 +726,10 @@ class OrderHandler:
                 status = result["response"]["data"]["statuses"][0]
                 if "resting" in status:
                     oid = status["resting"]["oid"]
-                    self.logger.info(f"Perp limit sell placed: order ID {oid}")
+                    self.logger.info("Perp limit sell placed: order ID %s", oid)
             return result
         except Exception as e:
-            self.logger.error(f"Error in perp limit sell: {str(e)}")
+            self.logger.error("Error in perp limit sell: %s", e)
             return {"status": "error", "message": str(e)}
         
     def limit_sell(self, symbol: str, size: float, price: float) -> Dict[str, Any]:
@@ -712,7 +752,7 @@ class OrderHandler:
             size_str = self._format_and_truncate(symbol, size, is_size=True)
             price_str = self._format_and_truncate(symbol, price, is_size=False)
             
-            self.logger.info(f"Placing limit sell: {size_str} {symbol} @ {price_str}")
+            self.logger.info("Placing limit sell: %s %s @ %s", size_str, symbol, price_str)
             
             # Convert back to float for the API call but with the properly formatted precision
             size_float = float(size_str)
@@ -724,10 +764,10 @@ class OrderHandler:
                 status = result["response"]["data"]["statuses"][0]
                 if "resting" in status:
                     oid = status["resting"]["oid"]
-                    self.logger.info(f"Limit sell placed: order ID {oid}")
+                    self.logger.info("Limit sell placed: order ID %s", oid)
             return result
         except Exception as e:
-            self.logger.error(f"Error in limit sell: {str(e)}")
+            self.logger.error("Error in limit sell: %s", e)
             return {"status": "error", "message": str(e)}
 
     def close_position(self, symbol: str, slippage: float = 0.05) -> Dict[str, Any]:
@@ -758,11 +798,11 @@ class OrderHandler:
             return {"status": "error", "message": "Not connected to exchange"}
             
         try:
-            self.logger.info(f"Setting {leverage}x leverage for {symbol}")
+            self.logger.info("Setting %sx leverage for %s", leverage, symbol)
             result = self.exchange.update_leverage(leverage, symbol)
             return result
         except Exception as e:
-            self.logger.error(f"Error setting leverage: {str(e)}")
+            self.logger.error("Error setting leverage: %s", e)
             return {"status": "error", "message": str(e)}
 # =================================Order Cancellation==============================================
     def cancel_order(self, symbol: str, order_id: int) -> Dict[str, Any]:
@@ -780,16 +820,16 @@ class OrderHandler:
             return {"status": "error", "message": "Not connected to exchange"}
             
         try:
-            self.logger.info(f"Cancelling order {order_id} for {symbol}")
+            self.logger.info("Cancelling order %s for %s", order_id, symbol)
             result = self.exchange.cancel(symbol, order_id)
             
             if result["status"] == "ok":
-                self.logger.info(f"Order {order_id} cancelled successfully")
+                self.logger.info("Order %s cancelled successfully", order_id)
             else:
-                self.logger.error(f"Failed to cancel order {order_id}: {result}")
+                self.logger.error("Failed to cancel order %s: %s", order_id, result)
             return result
         except Exception as e:
-            self.logger.error(f"Error cancelling order: {str(e)}")
+            self.logger.error("Error cancelling order: %s", e)
             return {"status": "error", "message": str(e)}
     
     def cancel_all_orders(self, symbol: Optional[str] = None) -> Dict[str, Any]:
@@ -806,23 +846,36 @@ class OrderHandler:
             return {"status": "error", "message": "Not connected to exchange"}
             
         try:
-            self.logger.info(f"Cancelling all orders{' for ' + symbol if symbol else ''}")
+            self.logger.info("Cancelling all orders%s", ' for ' + symbol if symbol else '')
             open_orders = self.info.open_orders(self.wallet_address)
+            cancel_requests = [
+                {"coin": order["coin"], "oid": order["oid"]}
+                for order in open_orders
+                if symbol is None or order["coin"] == symbol
+            ]
             
             results = {"cancelled": 0, "failed": 0, "details": []}
-            for order in open_orders:
-                if symbol is None or order["coin"] == symbol:
-                    result = self.cancel_order(order["coin"], order["oid"])
-                    if result["status"] == "ok":
-                        results["cancelled"] += 1
-                    else:
-                        results["failed"] += 1
-                    results["details"].append(result)
+            if cancel_requests:
+                # Cancel everything in one request instead of one round-trip per order
+                response = self.exchange.bulk_cancel(cancel_requests)
+                
+                if response["status"] == "ok":
+                    statuses = response["response"]["data"]["statuses"]
+                    for request, status in zip(cancel_requests, statuses):
+                        if isinstance(status, dict) and "error" in status:
+                            results["failed"] += 1
+                            results["details"].append({"status": "error", "oid": request["oid"], "message": status["error"]})
+                        else:
+                            results["cancelled"] += 1
+                            results["details"].append({"status": "ok", "oid": request["oid"]})
+                else:
+                    results["failed"] = len(cancel_requests)
+                    results["details"].append(response)
                     
-            self.logger.info(f"Cancelled {results['cancelled']} orders, {results['failed']} failed")
+            self.logger.info("Cancelled %s orders, %s failed", results['cancelled'], results['failed'])
             return {"status": "ok", "data": results}
         except Exception as e:
-            self.logger.error(f"Error cancelling all orders: {str(e)}")
+            self.logger.error("Error cancelling all orders: %s", e)
             return {"status": "error", "message": str(e)}
     
     def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -847,7 +900,7 @@ class OrderHandler:
                 
             return open_orders
         except Exception as e:
-            self.logger.error(f"Error getting open orders: {str(e)}")
+            self.logger.error("Error getting open orders: %s", e)
             return []
     
     def market_close_position(self, symbol: str, slippage: float = 0.05) -> Dict[str, Any]:
@@ -865,19 +918,19 @@ class OrderHandler:
             return {"status": "error", "message": "Not connected to exchange"}
             
         try:
-            self.logger.info(f"Closing position for {symbol}")
+            self.logger.info("Closing position for %s", symbol)
             result = self.exchange.market_close(symbol, None, None, slippage)
             
             if result["status"] == "ok":
                 for status in result["response"]["data"]["statuses"]:
                     if "filled" in status:
                         filled = status["filled"]
-                        self.logger.info(f"Position closed: {filled['totalSz']} @ {filled['avgPx']}")
+                        self.logger.info("Position closed: %s @ %s", filled['totalSz'], filled['avgPx'])
                     elif "error" in status:
-                        self.logger.error(f"Position close error: {status['error']}")
+                        self.logger.error("Position close error: %s", status['error'])
             return result
         except Exception as e:
-            self.logger.error(f"Error closing position: {str(e)}")
+            self.logger.error("Error closing position: %s", e)
             return {"status": "error", "message": str(e)}
         
 # =======================================TWAPS==================================================
@@ -885,6 +938,18 @@ class OrderHandler:
 class TwapExecution:
     """Handles TWAP (Time-Weighted Average Price) order execution"""
     
+    # OrderHandler method for each (is_perp, is_buy, is_limit) combination
+    ORDER_METHODS = {
+        (False, True, False): "market_buy",
+        (False, False, False): "market_sell",
+        (False, True, True): "limit_buy",
+        (False, False, True): "limit_sell",
+        (True, True, False): "perp_market_buy",
+        (True, False, False): "perp_market_sell",
+        (True, True, True): "perp_limit_buy",
+        (True, False, True): "perp_limit_sell",
+    }
+    
     def __init__(self, order_handler, symbol: str, side: str, total_quantity: float, 
                  duration_minutes: int, num_slices: int, price_limit: Optional[float] = None,
                  is_perp: bool = False, leverage: int = 1):
@@ -941,8 +1006,8 @@ class TwapExecution:
         self.is_running = True
         self.stop_event.clear()
         
-        self.logger.info(f"Starting TWAP execution for {self.total_quantity} {self.symbol} "
-                         f"over {self.duration_minutes} minutes in {self.num_slices} slices")
+        self.logger.info("Starting TWAP execution for %s %s over %s minutes in %s slices",
+                         self.total_quantity, self.symbol, self.duration_minutes, self.num_slices)
         
         # Start execution thread
         self.thread = threading.Thread(target=self._execute_strategy)
@@ -1005,25 +1070,22 @@ class TwapExecution:
                 if slice_num < self.num_slices - 1:
                     # Calculate time to wait
                     elapsed = time.time() - slice_start_time
-                    wait_time = max(0, self.interval_seconds - elapsed)
-                    
-                    # Wait, but check for stop event every second
-                    for _ in range(int(wait_time)):
-                        if self.stop_event.is_set():
-                            self.logger.info("TWAP execution stopped during interval wait")
-                            break
-                        time.sleep(1)
+                    wait_time = self.interval_seconds - elapsed
+                    if wait_time < 0:
+                        wait_time = 0
                     
-                    # Sleep any remaining fraction of a second
-                    time.sleep(wait_time - int(wait_time))
+                    # Wait for the next interval, waking immediately if stopped
+                    if self.stop_event.wait(wait_time):
+                        self.logger.info("TWAP execution stopped during interval wait")
+                        break
             
             if self.slices_executed == self.num_slices:
                 self.logger.info("TWAP execution completed successfully")
             else:
-                self.logger.info(f"TWAP execution stopped after {self.slices_executed}/{self.num_slices} slices")
+                self.logger.info("TWAP execution stopped after %s/%s slices", self.slices_executed, self.num_slices)
         
         except Exception as e:
-            self.logger.error(f"Error in TWAP execution: {str(e)}")
+            self.logger.error("Error in TWAP execution: %s", e)
             self.errors.append(str(e))
         
         finally:
@@ -1032,75 +1094,54 @@ class TwapExecution:
     def _execute_slice(self, slice_num: int) -> None:
         """Execute a single slice of the TWAP order"""
         try:
-            self.logger.info(f"Executing TWAP slice {slice_num}/{self.num_slices} for {self.quantity_per_slice} {self.symbol}")
+            self.logger.info("Executing TWAP slice %s/%s for %s %s", slice_num, self.num_slices, self.quantity_per_slice, self.symbol)
             
             # Execute the slice based on side and type (spot or perp)
-            result = None
+            is_limit = bool(self.price_limit)
+            order_method = getattr(self.order_handler,
+                                   self.ORDER_METHODS[(self.is_perp, self.side == 'buy', is_limit)])
             
+            args = [self.symbol, self.quantity_per_slice]
+            if is_limit:
+                args.append(self.price_limit)
             if self.is_perp:
-                # Perpetual order
-                if self.side == 'buy':
-                    if self.price_limit:
-                        result = self.order_handler.perp_limit_buy(self.symbol, self.quantity_per_slice, 
-                                                                  self.price_limit, self.leverage)
-                    else:
-                        result = self.order_handler.perp_market_buy(self.symbol, self.quantity_per_slice, 
-                                                                   self.leverage)
-                else:  # sell
-                    if self.price_limit:
-                        result = self.order_handler.perp_limit_sell(self.symbol, self.quantity_per_slice, 
-                                                                   self.price_limit, self.leverage)
-                    else:
-                        result = self.order_handler.perp_market_sell(self.symbol, self.quantity_per_slice, 
-                                                                    self.leverage)
-            else:
-                # Spot order
-                if self.side == 'buy':
-                    if self.price_limit:
-                        result = self.order_handler.limit_buy(self.symbol, self.quantity_per_slice, self.price_limit)
-                    else:
-                        result = self.order_handler.market_buy(self.symbol, self.quantity_per_slice)
-                else:  # sell
-                    if self.price_limit:
-                        result = self.order_handler.limit_sell(self.symbol, self.quantity_per_slice, self.price_limit)
-                    else:
-                        result = self.order_handler.market_sell(self.symbol, self.quantity_per_slice)
+                args.append(self.leverage)
+            result = order_method(*args)
             
             # Process the result
             if result and result["status"] == "ok":
-                if "response" in result and "data" in result["response"] and "statuses" in result["response"]["data"]:
-                    for status in result["response"]["data"]["statuses"]:
-                        if "filled" in status:
-                            filled = status["filled"]
-                            executed_qty = float(filled["totalSz"])
-                            executed_price = float(filled["avgPx"])
-                            
-                            self.total_executed += executed_qty
-                            self.execution_prices.append(executed_price)
-                            
-                            # Update average price
-                            if self.execution_prices:
-                                self.average_price = sum(self.execution_prices) / len(self.execution_prices)
-                            
-                            self.logger.info(f"TWAP slice {slice_num} executed: {executed_qty} @ {executed_price}")
+                statuses = result.get("response", {}).get("data", {}).get("statuses", [])
+                for status in statuses:
+                    if "filled" in status:
+                        filled = status["filled"]
+                        executed_qty = float(filled["totalSz"])
+                        executed_price = float(filled["avgPx"])
+                        
+                        self.total_executed += executed_qty
+                        self.execution_prices.append(executed_price)
+                        
+                        # Update average price
+                        if self.execution_prices:
+                            self.average_price = sum(self.execution_prices) / len(self.execution_prices)
+                        
+                        self.logger.info("TWAP slice %s executed: %s @ %s", slice_num, executed_qty, executed_price)
             else:
                 error_msg = result.get("message", "Unknown error") if result else "No result returned"
-                self.logger.error(f"TWAP slice {slice_num} failed: {error_msg}")
+                self.logger.error("TWAP slice %s failed: %s", slice_num, error_msg)
                 self.errors.append(f"Slice {slice_num}: {error_msg}")
         
         except Exception as e:
-            self.logger.error(f"Error executing TWAP slice {slice_num}: {str(e)}")
+            self.logger.error("Error executing TWAP slice %s: %s", slice_num, e)
             self.errors.append(f"Slice {slice_num}: {str(e)}")
 
 
     # Now add the TWAP manager methods to the OrderHandler class
-    def __init_twap_if_needed(self):
-        """Initialize TWAP components if needed"""
-        if not hasattr(self, 'active_twaps'):
-            self.active_twaps = {}  # Dictionary to store active TWAP executions by ID
-            self.completed_twaps = {}  # Dictionary to store completed TWAP executions by ID
-            self.twap_id_counter = 1
-            self.twap_lock = threading.Lock()  # Lock for thread safety
+    def _archive_finished_twaps(self) -> None:
+        """Move TWAP executions that finished on their own to completed (caller holds twap_lock)"""
+        finished = [twap_id for twap_id, twap in self.active_twaps.items()
+                    if twap.start_time is not None and not twap.is_running]
+        for twap_id in finished:
+            self.completed_twaps[twap_id] = self.active_twaps.pop(twap_id)
 
     def create_twap(self, symbol: str, side: str, quantity: float, 
                 duration_minutes: int, num_slices: int, 
@@ -1122,8 +1163,6 @@ class TwapExecution:
         Returns:
             str: A unique ID for the TWAP execution
         """
-        self.__init_twap_if_needed()
-        
         with self.twap_lock:
             twap_id = f"twap_{datetime.now().strftime('%Y%m%d%H%M%S')}_{self.twap_id_counter}"
             self.twap_id_counter += 1
@@ -1141,7 +1180,7 @@ class TwapExecution:
             )
             
             self.active_twaps[twap_id] = twap
-            self.logger.info(f"Created TWAP {twap_id} for {quantity} {symbol}")
+            self.logger.info("Created TWAP %s for %s %s", twap_id, quantity, symbol)
             
             return twap_id
 
@@ -1155,20 +1194,18 @@ class TwapExecution:
         Returns:
             bool: True if started successfully, False otherwise
         """
-        self.__init_twap_if_needed()
-        
         with self.twap_lock:
             if twap_id not in self.active_twaps:
-                self.logger.error(f"Cannot start TWAP {twap_id} - not found")
+                self.logger.error("Cannot start TWAP %s - not found", twap_id)
                 return False
             
             twap = self.active_twaps[twap_id]
             success = twap.start()
             
             if success:
-                self.logger.info(f"Started TWAP {twap_id}")
+                self.logger.info("Started TWAP %s", twap_id)
             else:
-                self.logger.warning(f"Failed to start TWAP {twap_id}")
+                self.logger.warning("Failed to start TWAP %s", twap_id)
             
             return success
 
@@ -1182,25 +1219,23 @@ class TwapExecution:
         Returns:
             bool: True if stopped successfully, False otherwise
         """
-        self.__init_twap_if_needed()
-        
         with self.twap_lock:
             if twap_id not in self.active_twaps:
-                self.logger.error(f"Cannot stop TWAP {twap_id} - not found")
+                self.logger.error("Cannot stop TWAP %s - not found", twap_id)
                 return False
             
             twap = self.active_twaps[twap_id]
             success = twap.stop()
             
             if success:
-                self.logger.info(f"Stopped TWAP {twap_id}")
+                self.logger.info("Stopped TWAP %s", twap_id)
                 
                 # Move to completed if it's no longer running
                 if not twap.is_running:
                     self.completed_twaps[twap_id] = twap
                     del self.active_twaps[twap_id]
             else:
-                self.logger.warning(f"Failed to stop TWAP {twap_id}")
+                self.logger.warning("Failed to stop TWAP %s", twap_id)
             
             return success
 
@@ -1214,9 +1249,9 @@ class TwapExecution:
         Returns:
             Dict or None: The status of the TWAP execution, or None if not found
         """
-        self.__init_twap_if_needed()
-        
         with self.twap_lock:
+            self._archive_finished_twaps()
+            
             if twap_id in self.active_twaps:
                 twap = self.active_twaps[twap_id]
                 status = twap.get_status()
@@ -1230,7 +1265,7 @@ class TwapExecution:
                 status["status"] = "completed"
                 return status
             else:
-                self.logger.error(f"Cannot get status for TWAP {twap_id} - not found")
+                self.logger.error("Cannot get status for TWAP %s - not found", twap_id)
                 return None
 
     def list_twaps(self) -> Dict[str, List[Dict[str, Any]]]:
@@ -1240,9 +1275,9 @@ class TwapExecution:
         Returns:
             Dict: A dictionary with 'active' and 'completed' lists of TWAP executions
         """
-        self.__init_twap_if_needed()
-        
         with self.twap_lock:
+            self._archive_finished_twaps()
+            
             active = []
             for twap_id, twap in self.active_twaps.items():
                 status = twap.get_status()
@@ -1269,12 +1304,10 @@ class TwapExecution:
         Returns:
             int: The number of completed TWAP executions that were cleaned up
         """
-        self.__init_twap_if_needed()
-        
         with self.twap_lock:
             count = len(self.completed_twaps)
             self.completed_twaps.clear()
-            self.logger.info(f"Cleaned up {count} completed TWAP executions")
+            self.logger.info("Cleaned up %s completed TWAP executions", count)
             return count
 
     def stop_all_twaps(self) -> int:
@@ -1284,8 +1317,6 @@ class TwapExecution:
         Returns:
             int: The number of TWAP executions that were stopped
         """
-        self.__init_twap_if_needed()
-        
         with self.twap_lock:
             count = 0
             twap_ids = list(self.active_twaps.keys())
@@ -1294,11 +1325,11 @@ class TwapExecution:
                 if self.stop_twap(twap_id):
                     count += 1
             
-            self.logger.info(f"Stopped {count} TWAP executions")
+            self.logger.info("Stopped %s TWAP executions", count)
             return count
 
     # Add methods to OrderHandler class
-    OrderHandler.__init_twap_if_needed = __init_twap_if_needed
+    OrderHandler._archive_finished_twaps = _archive_finished_twaps
     OrderHandler.create_twap = create_twap
     OrderHandler.start_twap = start_twap
     OrderHandler.stop_twap = stop_twap
@@ -1,11 +1,23 @@
 import cmd
 import os
 import time
-import threading
 import json
-import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from functools import wraps
+from typing import Tuple
+
+
+def requires_connection(func):
+    """Decorator for commands that need an exchange connection"""
+    @wraps(func)
+    def wrapper(self, arg):
+        if not self.api_connector.exchange:
+            print("Not connected to exchange. Use 'connect' first.")
+            return
+        return func(self, arg)
+    return wrapper
+
 
 class ElysiumTerminalUI(cmd.Cmd):
     """Command-line interface for Elysium Trading Platform"""
@@ -13,6 +25,10 @@ class ElysiumTerminalUI(cmd.Cmd):
     VERSION = "1.0.0"
     intro = None
 
+    # Accepted argument values for command parsing
+    ORDER_SIDES = frozenset(("buy", "sell"))
+    TRUE_VALUES = frozenset(("true", "t", "yes", "y", "1"))
+
     ASCII_ART = '''
     ███████╗██╗  ██╗   ██╗███████╗██╗██╗   ██╗███╗   ███╗
     ██╔════╝██║  ╚██╗ ██╔╝██╔════╝██║██║   ██║████╗ ████║
@@ -73,6 +89,67 @@ class ElysiumTerminalUI(cmd.Cmd):
     - help        List all commands
     '''
 
+    HELP_SCALED_MSG = '''
+=== Scaled Orders Help ===
+
+Scaled orders place multiple limit orders across a price range.
+They can help you get better average entry or exit prices by spreading orders.
+
+Commands:
+  scaled_buy      - Place multiple spot buy orders across a price range
+  scaled_sell     - Place multiple spot sell orders across a price range
+  perp_scaled_buy  - Place multiple perpetual buy orders across a price range
+  perp_scaled_sell - Place multiple perpetual sell orders across a price range
+
+Skew parameter:
+  0.0 = Linear distribution (equal size for all orders)
+  >0  = Exponential distribution (larger orders at better prices)
+  1.0 = Moderate skew
+  2.0 = Stronger skew
+  3.0+ = Very aggressive skew
+
+Examples:
+  scaled_buy ETH 0.5 5 3200 3000 0
+  Places 5 buy orders totaling 0.5 ETH from $3200 down to $3000 with equal sizes
+
+  scaled_sell ETH 0.5 5 3000 3200 2
+  Places 5 sell orders totaling 0.5 ETH from $3000 up to $3200 with more size on lower prices
+
+  perp_scaled_buy BTC 0.1 5 65000 64000 5 1
+  Places 5 perpetual buy orders totaling 0.1 BTC from $65000 down to $64000 with 5x leverage
+  and moderately larger sizes on higher prices
+
+Price Direction:
+  For buy orders: start_price should be higher than end_price
+  For sell orders: start_price should be lower than end_price
+  (The system will automatically swap them if provided in the wrong order)'''
+
+    HELP_MARKET_SCALED_MSG = '''
+=== Market-Aware Scaled Orders Help ===
+
+Market-aware scaled orders automatically adjust to current market conditions.
+They help you place orders at realistic prices based on the current order book.
+
+Commands:
+  market_scaled_buy  - Place multiple buy orders from below ask to best bid
+  market_scaled_sell - Place multiple sell orders from best ask to above bid
+
+Parameters:
+  symbol       - Trading pair symbol (e.g., ETH or PURR/USDC)
+  total_size   - Total size to be distributed across all orders
+  num_orders   - Number of orders to place
+  price_percent - How far from market price to start/end (default: 3%)
+  skew         - Order size distribution (0=equal, >0=weighted)
+
+Example for buying:
+  market_scaled_buy PURR/USDC 10 5 2 0
+  Places 5 buy orders totaling 10 PURR from 2% below best ask down to best bid
+
+Example for selling:
+  market_scaled_sell ETH 0.5 4 3 1
+  Places 4 sell orders totaling 0.5 ETH from best ask up to 3% above best bid
+  With skew=1, more ETH is placed at lower prices'''
+
     def __init__(self, api_connector, order_handler, config_manager):
         super().__init__()
         self.prompt = '>>> '
@@ -81,6 +158,7 @@ class ElysiumTerminalUI(cmd.Cmd):
         self.config_manager = config_manager
         self.authenticated = False
         self.last_command_output = ""
+        self._credentials = None  # Loaded from dontshareconfig.py on first connect
         
     def preloop(self):
         """Setup before starting the command loop"""
@@ -129,6 +207,16 @@ class ElysiumTerminalUI(cmd.Cmd):
         print(self.ASCII_ART)
         print(self.WELCOME_MSG)
         
+    def _get_credentials(self, network_name: str) -> Tuple[str, str]:
+        """Get (wallet_address, secret_key) for a network, importing dontshareconfig.py once"""
+        if self._credentials is None:
+            import dontshareconfig as ds
+            self._credentials = {
+                "mainnet": (ds.mainnet_wallet, ds.mainnet_secret),
+                "testnet": (ds.testnet_wallet, ds.testnet_secret)
+            }
+        return self._credentials[network_name]
+        
     def do_connect(self, arg):
         """
         Connect to Hyperliquid exchange
@@ -148,16 +236,8 @@ class ElysiumTerminalUI(cmd.Cmd):
                 use_testnet = False
                 network_name = "mainnet"
             
-            # Import credentials from dontshareconfig.py
-            import dontshareconfig as ds
-            
             # Select the appropriate credentials based on network
-            if use_testnet:
-                wallet_address = ds.testnet_wallet
-                secret_key = ds.testnet_secret
-            else:
-                wallet_address = ds.mainnet_wallet
-                secret_key = ds.mainnet_secret
+            wallet_address, secret_key = self._get_credentials(network_name)
             
             print(f"\nConnecting to Hyperliquid ({network_name})...")
             success = self.api_connector.connect_hyperliquid(wallet_address, secret_key, use_testnet)
@@ -174,38 +254,39 @@ class ElysiumTerminalUI(cmd.Cmd):
         except Exception as e:
             print(f"Error connecting to exchange: {str(e)}")
     
+    @requires_connection
     def do_balance(self, arg):
         """
         Show current balance across spot and perpetual markets
         Usage: balance
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             print("\n=== Current Balances ===")
             
+            # Fetch spot and perpetual state concurrently rather than back to back
+            info = self.api_connector.info
+            wallet_address = self.api_connector.wallet_address
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                spot_future = pool.submit(info.spot_user_state, wallet_address)
+                perp_future = pool.submit(info.user_state, wallet_address)
+                spot_state = spot_future.result()
+                perp_state = perp_future.result()
+            
             # Display spot balances
             print("\nSpot Balances:")
-            spot_state = self.api_connector.info.spot_user_state(self.api_connector.wallet_address)
             
             headers = ["Asset", "Available", "Total", "In Orders"]
             rows = []
             
             for balance in spot_state.get("balances", []):
-                rows.append([
-                    balance.get("coin", ""),
-                    float(balance.get("available", 0)),
-                    float(balance.get("total", 0)),
-                    float(balance.get("total", 0)) - float(balance.get("available", 0))
-                ])
+                available = float(balance.get("available", 0))
+                total = float(balance.get("total", 0))
+                rows.append([balance.get("coin", ""), available, total, total - available])
             
             self._print_table(headers, rows)
             
             # Display perpetual balance
             print("\nPerpetual Account Summary:")
-            perp_state = self.api_connector.info.user_state(self.api_connector.wallet_address)
             margin_summary = perp_state.get("marginSummary", {})
             
             headers = ["Metric", "Value"]
@@ -220,16 +301,13 @@ class ElysiumTerminalUI(cmd.Cmd):
         except Exception as e:
             print(f"\nError fetching balances: {str(e)}")
     
+    @requires_connection
     def do_buy(self, arg):
         """
         Execute a market buy order
         Usage: buy <symbol> <size> [slippage]
         Example: buy ETH 0.1 0.05
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             args = arg.split()
             if len(args) < 2:
@@ -246,27 +324,23 @@ class ElysiumTerminalUI(cmd.Cmd):
             if result["status"] == "ok":
                 print("Market buy order executed successfully")
                 # Display the details
-                if "response" in result and "data" in result["response"] and "statuses" in result["response"]["data"]:
-                    for status in result["response"]["data"]["statuses"]:
-                        if "filled" in status:
-                            filled = status["filled"]
-                            print(f"Filled: {filled['totalSz']} @ {filled['avgPx']}")
+                for status in self._order_statuses(result):
+                    if "filled" in status:
+                        filled = status["filled"]
+                        print(f"Filled: {filled['totalSz']} @ {filled['avgPx']}")
             else:
                 print(f"Market buy order failed: {result.get('message', 'Unknown error')}")
                 
         except Exception as e:
             print(f"\nError executing market buy: {str(e)}")
     
+    @requires_connection
     def do_sell(self, arg):
         """
         Execute a market sell order
         Usage: sell <symbol> <size> [slippage]
         Example: sell ETH 0.1 0.05
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             args = arg.split()
             if len(args) < 2:
@@ -283,27 +357,23 @@ class ElysiumTerminalUI(cmd.Cmd):
             if result["status"] == "ok":
                 print("Market sell order executed successfully")
                 # Display the details
-                if "response" in result and "data" in result["response"] and "statuses" in result["response"]["data"]:
-                    for status in result["response"]["data"]["statuses"]:
-                        if "filled" in status:
-                            filled = status["filled"]
-                            print(f"Filled: {filled['totalSz']} @ {filled['avgPx']}")
+                for status in self._order_statuses(result):
+                    if "filled" in status:
+                        filled = status["filled"]
+                        print(f"Filled: {filled['totalSz']} @ {filled['avgPx']}")
             else:
                 print(f"Market sell order failed: {result.get('message', 'Unknown error')}")
                 
         except Exception as e:
             print(f"\nError executing market sell: {str(e)}")
     
+    @requires_connection
     def do_limit_buy(self, arg):
         """
         Place a limit buy order
         Usage: limit_buy <symbol> <size> <price>
         Example: limit_buy ETH 0.1 3000
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             args = arg.split()
             if len(args) < 3:
@@ -320,8 +390,9 @@ class ElysiumTerminalUI(cmd.Cmd):
             if result["status"] == "ok":
                 print("Limit buy order placed successfully")
                 # Display the order ID
-                if "response" in result and "data" in result["response"] and "statuses" in result["response"]["data"]:
-                    status = result["response"]["data"]["statuses"][0]
+                statuses = self._order_statuses(result)
+                if statuses:
+                    status = statuses[0]
                     if "resting" in status:
                         oid = status["resting"]["oid"]
                         print(f"Order ID: {oid}")
@@ -331,16 +402,13 @@ class ElysiumTerminalUI(cmd.Cmd):
         except Exception as e:
             print(f"\nError placing limit buy order: {str(e)}")
     
+    @requires_connection
     def do_limit_sell(self, arg):
         """
         Place a limit sell order
         Usage: limit_sell <symbol> <size> <price>
         Example: limit_sell ETH 0.1 3500
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             args = arg.split()
             if len(args) < 3:
@@ -357,8 +425,9 @@ class ElysiumTerminalUI(cmd.Cmd):
             if result["status"] == "ok":
                 print("Limit sell order placed successfully")
                 # Display the order ID
-                if "response" in result and "data" in result["response"] and "statuses" in result["response"]["data"]:
-                    status = result["response"]["data"]["statuses"][0]
+                statuses = self._order_statuses(result)
+                if statuses:
+                    status = statuses[0]
                     if "resting" in status:
                         oid = status["resting"]["oid"]
                         print(f"Order ID: {oid}")
@@ -370,16 +439,13 @@ class ElysiumTerminalUI(cmd.Cmd):
 
     # =================================Perp Trading==============================================
 
+    @requires_connection
     def do_perp_buy(self, arg):
         """
         Execute a perpetual market buy order
         Usage: perp_buy <symbol> <size> [leverage] [slippage]
         Example: perp_buy BTC 0.01 5 0.03
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             args = arg.split()
             if len(args) < 2:
@@ -397,27 +463,23 @@ class ElysiumTerminalUI(cmd.Cmd):
             if result["status"] == "ok":
                 print("Perpetual market buy order executed successfully")
                 # Display the details
-                if "response" in result and "data" in result["response"] and "statuses" in result["response"]["data"]:
-                    for status in result["response"]["data"]["statuses"]:
-                        if "filled" in status:
-                            filled = status["filled"]
-                            print(f"Filled: {filled['totalSz']} @ {filled['avgPx']}")
+                for status in self._order_statuses(result):
+                    if "filled" in status:
+                        filled = status["filled"]
+                        print(f"Filled: {filled['totalSz']} @ {filled['avgPx']}")
             else:
                 print(f"Perpetual market buy order failed: {result.get('message', 'Unknown error')}")
                 
         except Exception as e:
             print(f"\nError executing perpetual market buy: {str(e)}")
 
+    @requires_connection
     def do_perp_sell(self, arg):
         """
         Execute a perpetual market sell order
         Usage: perp_sell <symbol> <size> [leverage] [slippage]
         Example: perp_sell BTC 0.01 5 0.03
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             args = arg.split()
             if len(args) < 2:
@@ -435,27 +497,23 @@ class ElysiumTerminalUI(cmd.Cmd):
             if result["status"] == "ok":
                 print("Perpetual market sell order executed successfully")
                 # Display the details
-                if "response" in result and "data" in result["response"] and "statuses" in result["response"]["data"]:
-                    for status in result["response"]["data"]["statuses"]:
-                        if "filled" in status:
-                            filled = status["filled"]
-                            print(f"Filled: {filled['totalSz']} @ {filled['avgPx']}")
+                for status in self._order_statuses(result):
+                    if "filled" in status:
+                        filled = status["filled"]
+                        print(f"Filled: {filled['totalSz']} @ {filled['avgPx']}")
             else:
                 print(f"Perpetual market sell order failed: {result.get('message', 'Unknown error')}")
                 
         except Exception as e:
             print(f"\nError executing perpetual market sell: {str(e)}")
 
+    @requires_connection
     def do_perp_limit_buy(self, arg):
         """
         Place a perpetual limit buy order
         Usage: perp_limit_buy <symbol> <size> <price> [leverage]
         Example: perp_limit_buy BTC 0.01 50000 5
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             args = arg.split()
             if len(args) < 3:
@@ -473,8 +531,9 @@ class ElysiumTerminalUI(cmd.Cmd):
             if result["status"] == "ok":
                 print("Perpetual limit buy order placed successfully")
                 # Display the order ID
-                if "response" in result and "data" in result["response"] and "statuses" in result["response"]["data"]:
-                    status = result["response"]["data"]["statuses"][0]
+                statuses = self._order_statuses(result)
+                if statuses:
+                    status = statuses[0]
                     if "resting" in status:
                         oid = status["resting"]["oid"]
                         print(f"Order ID: {oid}")
@@ -484,16 +543,13 @@ class ElysiumTerminalUI(cmd.Cmd):
         except Exception as e:
             print(f"\nError placing perpetual limit buy order: {str(e)}")
 
+    @requires_connection
     def do_perp_limit_sell(self, arg):
         """
         Place a perpetual limit sell order
         Usage: perp_limit_sell <symbol> <size> <price> [leverage]
         Example: perp_limit_sell BTC 0.01 60000 5
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             args = arg.split()
             if len(args) < 3:
@@ -511,8 +567,9 @@ class ElysiumTerminalUI(cmd.Cmd):
             if result["status"] == "ok":
                 print("Perpetual limit sell order placed successfully")
                 # Display the order ID
-                if "response" in result and "data" in result["response"] and "statuses" in result["response"]["data"]:
-                    status = result["response"]["data"]["statuses"][0]
+                statuses = self._order_statuses(result)
+                if statuses:
+                    status = statuses[0]
                     if "resting" in status:
                         oid = status["resting"]["oid"]
                         print(f"Order ID: {oid}")
@@ -522,16 +579,13 @@ class ElysiumTerminalUI(cmd.Cmd):
         except Exception as e:
             print(f"\nError placing perpetual limit sell order: {str(e)}")
 # ===================Close Position============================
+    @requires_connection
     def do_close_position(self, arg):
         """
         Close an entire perpetual position
         Usage: close_position <symbol> [slippage]
         Example: close_position BTC 0.03
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             args = arg.split()
             if len(args) < 1:
@@ -547,11 +601,10 @@ class ElysiumTerminalUI(cmd.Cmd):
             if result["status"] == "ok":
                 print("Position closed successfully")
                 # Display the details
-                if "response" in result and "data" in result["response"] and "statuses" in result["response"]["data"]:
-                    for status in result["response"]["data"]["statuses"]:
-                        if "filled" in status:
-                            filled = status["filled"]
-                            print(f"Filled: {filled['totalSz']} @ {filled['avgPx']}")
+                for status in self._order_statuses(result):
+                    if "filled" in status:
+                        filled = status["filled"]
+                        print(f"Filled: {filled['totalSz']} @ {filled['avgPx']}")
             else:
                 print(f"Position close failed: {result.get('message', 'Unknown error')}")
                 
@@ -560,16 +613,13 @@ class ElysiumTerminalUI(cmd.Cmd):
 
 # ============================ Leverage Setting ===============================
 
+    @requires_connection
     def do_set_leverage(self, arg):
         """
         Set leverage for a symbol
         Usage: set_leverage <symbol> <leverage>
         Example: set_leverage BTC 5
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             args = arg.split()
             if len(args) < 2:
@@ -591,6 +641,7 @@ class ElysiumTerminalUI(cmd.Cmd):
             print(f"\nError setting leverage: {str(e)}")
 
     # ================================Scaled Order Part=====================================
+    @requires_connection
     def do_scaled_buy(self, arg):
         """
         Place multiple buy orders across a price range (scaled orders)
@@ -600,10 +651,6 @@ class ElysiumTerminalUI(cmd.Cmd):
         Start price should be higher than end price for buy orders.
         Skew value (optional): 0 = linear distribution, >0 = more weight to higher prices
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             args = arg.split()
             if len(args) < 5:
@@ -632,26 +679,14 @@ class ElysiumTerminalUI(cmd.Cmd):
             )
             
             if result["status"] == "ok":
-                print(f"\n{result['message']}")
-                
-                # Display order details
-                headers = ["Order #", "Size", "Price"]
-                rows = []
-                
-                for i in range(len(result["sizes"])):
-                    rows.append([
-                        f"{i+1}/{num_orders}",
-                        f"{result['sizes'][i]:.8f}",
-                        f"{result['prices'][i]:.8f}"
-                    ])
-                
-                self._print_table(headers, rows)
+                self._print_scaled_results(result, num_orders)
             else:
                 print(f"\nScaled buy order failed: {result.get('message', 'Unknown error')}")
                 
         except Exception as e:
             print(f"\nError executing scaled buy: {str(e)}")
     
+    @requires_connection
     def do_scaled_sell(self, arg):
         """
         Place multiple sell orders across a price range (scaled orders)
@@ -661,10 +696,6 @@ class ElysiumTerminalUI(cmd.Cmd):
         Start price should be lower than end price for sell orders.
         Skew value (optional): 0 = linear distribution, >0 = more weight to lower prices
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             args = arg.split()
             if len(args) < 5:
@@ -693,26 +724,14 @@ class ElysiumTerminalUI(cmd.Cmd):
             )
             
             if result["status"] == "ok":
-                print(f"\n{result['message']}")
-                
-                # Display order details
-                headers = ["Order #", "Size", "Price"]
-                rows = []
-                
-                for i in range(len(result["sizes"])):
-                    rows.append([
-                        f"{i+1}/{num_orders}",
-                        f"{result['sizes'][i]:.8f}",
-                        f"{result['prices'][i]:.8f}"
-                    ])
-                
-                self._print_table(headers, rows)
+                self._print_scaled_results(result, num_orders)
             else:
                 print(f"\nScaled sell order failed: {result.get('message', 'Unknown error')}")
                 
         except Exception as e:
             print(f"\nError executing scaled sell: {str(e)}")
     
+    @requires_connection
     def do_perp_scaled_buy(self, arg):
         """
         Place multiple perpetual buy orders across a price range (scaled orders)
@@ -723,10 +742,6 @@ class ElysiumTerminalUI(cmd.Cmd):
         Leverage (optional): Leverage to use (default: 1)
         Skew value (optional): 0 = linear distribution, >0 = more weight to higher prices
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             args = arg.split()
             if len(args) < 5:
@@ -757,26 +772,14 @@ class ElysiumTerminalUI(cmd.Cmd):
             )
             
             if result["status"] == "ok":
-                print(f"\n{result['message']}")
-                
-                # Display order details
-                headers = ["Order #", "Size", "Price"]
-                rows = []
-                
-                for i in range(len(result["sizes"])):
-                    rows.append([
-                        f"{i+1}/{num_orders}",
-                        f"{result['sizes'][i]:.8f}",
-                        f"{result['prices'][i]:.8f}"
-                    ])
-                
-                self._print_table(headers, rows)
+                self._print_scaled_results(result, num_orders)
             else:
                 print(f"\nScaled perpetual buy order failed: {result.get('message', 'Unknown error')}")
                 
         except Exception as e:
             print(f"\nError executing scaled perpetual buy: {str(e)}")
     
+    @requires_connection
     def do_perp_scaled_sell(self, arg):
         """
         Place multiple perpetual sell orders across a price range (scaled orders)
@@ -787,10 +790,6 @@ class ElysiumTerminalUI(cmd.Cmd):
         Leverage (optional): Leverage to use (default: 1)
         Skew value (optional): 0 = linear distribution, >0 = more weight to lower prices
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             args = arg.split()
             if len(args) < 5:
@@ -821,20 +820,7 @@ class ElysiumTerminalUI(cmd.Cmd):
             )
             
             if result["status"] == "ok":
-                print(f"\n{result['message']}")
-                
-                # Display order details
-                headers = ["Order #", "Size", "Price"]
-                rows = []
-                
-                for i in range(len(result["sizes"])):
-                    rows.append([
-                        f"{i+1}/{num_orders}",
-                        f"{result['sizes'][i]:.8f}",
-                        f"{result['prices'][i]:.8f}"
-                    ])
-                
-                self._print_table(headers, rows)
+                self._print_scaled_results(result, num_orders)
             else:
                 print(f"\nScaled perpetual sell order failed: {result.get('message', 'Unknown error')}")
                 
@@ -846,39 +832,9 @@ class ElysiumTerminalUI(cmd.Cmd):
         Show help about scaled orders functionality
         Usage: help_scaled
         """
-        print("\n=== Scaled Orders Help ===")
-        print("\nScaled orders place multiple limit orders across a price range.")
-        print("They can help you get better average entry or exit prices by spreading orders.")
-        
-        print("\nCommands:")
-        print("  scaled_buy      - Place multiple spot buy orders across a price range")
-        print("  scaled_sell     - Place multiple spot sell orders across a price range")
-        print("  perp_scaled_buy  - Place multiple perpetual buy orders across a price range")
-        print("  perp_scaled_sell - Place multiple perpetual sell orders across a price range")
-        
-        print("\nSkew parameter:")
-        print("  0.0 = Linear distribution (equal size for all orders)")
-        print("  >0  = Exponential distribution (larger orders at better prices)")
-        print("  1.0 = Moderate skew")
-        print("  2.0 = Stronger skew")
-        print("  3.0+ = Very aggressive skew")
-        
-        print("\nExamples:")
-        print("  scaled_buy ETH 0.5 5 3200 3000 0")
-        print("  Places 5 buy orders totaling 0.5 ETH from $3200 down to $3000 with equal sizes")
-        
-        print("\n  scaled_sell ETH 0.5 5 3000 3200 2")
-        print("  Places 5 sell orders totaling 0.5 ETH from $3000 up to $3200 with more size on lower prices")
-        
-        print("\n  perp_scaled_buy BTC 0.1 5 65000 64000 5 1")
-        print("  Places 5 perpetual buy orders totaling 0.1 BTC from $65000 down to $64000 with 5x leverage")
-        print("  and moderately larger sizes on higher prices")
-        
-        print("\nPrice Direction:")
-        print("  For buy orders: start_price should be higher than end_price")
-        print("  For sell orders: start_price should be lower than end_price")
-        print("  (The system will automatically swap them if provided in the wrong order)")
+        print(self.HELP_SCALED_MSG)
     # ================================Scaled Market order=====================================
+    @requires_connection
     def do_market_scaled_buy(self, arg):
         """
         Place multiple buy orders across a price range (scaled orders) with market awareness
@@ -889,10 +845,6 @@ class ElysiumTerminalUI(cmd.Cmd):
         The price_percent parameter determines how far below the best ask to start (default: 3%).
         Skew value (optional): 0 = linear distribution, >0 = more weight to higher prices
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             args = arg.split()
             if len(args) < 3:
@@ -950,20 +902,7 @@ class ElysiumTerminalUI(cmd.Cmd):
                 )
                 
                 if result["status"] == "ok":
-                    print(f"\n{result['message']}")
-                    
-                    # Display order details
-                    headers = ["Order #", "Size", "Price"]
-                    rows = []
-                    
-                    for i in range(len(result["sizes"])):
-                        rows.append([
-                            f"{i+1}/{num_orders}",
-                            f"{result['sizes'][i]:.8f}",
-                            f"{result['prices'][i]:.8f}"
-                        ])
-                    
-                    self._print_table(headers, rows)
+                    self._print_scaled_results(result, num_orders)
                 else:
                     print(f"\nMarket-aware scaled buy order failed: {result.get('message', 'Unknown error')}")
                 
@@ -974,6 +913,7 @@ class ElysiumTerminalUI(cmd.Cmd):
         except Exception as e:
             print(f"\nError executing market-aware scaled buy: {str(e)}")
             
+    @requires_connection
     def do_market_scaled_sell(self, arg):
         """
         Place multiple sell orders across a price range (scaled orders) with market awareness
@@ -984,10 +924,6 @@ class ElysiumTerminalUI(cmd.Cmd):
         The price_percent parameter determines how far above the best bid to end (default: 3%).
         Skew value (optional): 0 = linear distribution, >0 = more weight to lower prices
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             args = arg.split()
             if len(args) < 3:
@@ -1045,20 +981,7 @@ class ElysiumTerminalUI(cmd.Cmd):
                 )
                 
                 if result["status"] == "ok":
-                    print(f"\n{result['message']}")
-                    
-                    # Display order details
-                    headers = ["Order #", "Size", "Price"]
-                    rows = []
-                    
-                    for i in range(len(result["sizes"])):
-                        rows.append([
-                            f"{i+1}/{num_orders}",
-                            f"{result['sizes'][i]:.8f}",
-                            f"{result['prices'][i]:.8f}"
-                        ])
-                    
-                    self._print_table(headers, rows)
+                    self._print_scaled_results(result, num_orders)
                 else:
                     print(f"\nMarket-aware scaled sell order failed: {result.get('message', 'Unknown error')}")
                 
@@ -1074,41 +997,16 @@ class ElysiumTerminalUI(cmd.Cmd):
         Show help about market-aware scaled orders functionality
         Usage: help_market_scaled
         """
-        print("\n=== Market-Aware Scaled Orders Help ===")
-        print("\nMarket-aware scaled orders automatically adjust to current market conditions.")
-        print("They help you place orders at realistic prices based on the current order book.")
-        
-        print("\nCommands:")
-        print("  market_scaled_buy  - Place multiple buy orders from below ask to best bid")
-        print("  market_scaled_sell - Place multiple sell orders from best ask to above bid")
-        
-        print("\nParameters:")
-        print("  symbol       - Trading pair symbol (e.g., ETH or PURR/USDC)")
-        print("  total_size   - Total size to be distributed across all orders")
-        print("  num_orders   - Number of orders to place")
-        print("  price_percent - How far from market price to start/end (default: 3%)")
-        print("  skew         - Order size distribution (0=equal, >0=weighted)")
-        
-        print("\nExample for buying:")
-        print("  market_scaled_buy PURR/USDC 10 5 2 0")
-        print("  Places 5 buy orders totaling 10 PURR from 2% below best ask down to best bid")
-        
-        print("\nExample for selling:")
-        print("  market_scaled_sell ETH 0.5 4 3 1")
-        print("  Places 4 sell orders totaling 0.5 ETH from best ask up to 3% above best bid")
-        print("  With skew=1, more ETH is placed at lower prices")
+        print(self.HELP_MARKET_SCALED_MSG)
     # ================================Cancellation of Orders=====================================
     
+    @requires_connection
     def do_cancel(self, arg):
         """
         Cancel a specific order
         Usage: cancel <symbol> <order_id>
         Example: cancel ETH 123456
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             args = arg.split()
             if len(args) < 2:
@@ -1129,18 +1027,15 @@ class ElysiumTerminalUI(cmd.Cmd):
         except Exception as e:
             print(f"\nError cancelling order: {str(e)}")
     
+    @requires_connection
     def do_cancel_all(self, arg):
         """
         Cancel all open orders, optionally for a specific symbol
         Usage: cancel_all [symbol]
         Example: cancel_all ETH
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
-            symbol = arg.strip() if arg.strip() else None
+            symbol = arg.strip() or None
             symbol_text = f" for {symbol}" if symbol else ""
             
             print(f"\nCancelling all orders{symbol_text}")
@@ -1156,18 +1051,15 @@ class ElysiumTerminalUI(cmd.Cmd):
         except Exception as e:
             print(f"\nError cancelling orders: {str(e)}")
     
+    @requires_connection
     def do_orders(self, arg):
         """
         List all open orders, optionally for a specific symbol
         Usage: orders [symbol]
         Example: orders ETH
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
-            symbol = arg.strip() if arg.strip() else None
+            symbol = arg.strip() or None
             symbol_text = f" for {symbol}" if symbol else ""
             
             print(f"\n=== Open Orders{symbol_text} ===")
@@ -1195,47 +1087,33 @@ class ElysiumTerminalUI(cmd.Cmd):
         except Exception as e:
             print(f"\nError fetching open orders: {str(e)}")
     
+    @requires_connection
     def do_positions(self, arg):
         """
         Show current positions
         Usage: positions
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             print("\n=== Current Positions ===")
-            positions = []
+            rows = []
             
+            # Build the table rows directly, parsing each field once
             perp_state = self.api_connector.info.user_state(self.api_connector.wallet_address)
             for asset_position in perp_state.get("assetPositions", []):
                 position = asset_position.get("position", {})
-                if float(position.get("szi", 0)) != 0:
-                    positions.append({
-                        "symbol": position.get("coin", ""),
-                        "size": float(position.get("szi", 0)),
-                        "entry_price": float(position.get("entryPx", 0)),
-                        "mark_price": float(position.get("markPx", 0)),
-                        "liquidation_price": float(position.get("liquidationPx", 0) or 0),
-                        "unrealized_pnl": float(position.get("unrealizedPnl", 0)),
-                        "margin_used": float(position.get("marginUsed", 0))
-                    })
-            
-            if positions:
-                headers = ["Symbol", "Size", "Entry Price", "Mark Price", "Unrealized PnL", "Margin Used"]
-                rows = []
-                
-                for pos in positions:
+                size = float(position.get("szi", 0))
+                if size != 0:
                     rows.append([
-                        pos["symbol"],
-                        pos["size"],
-                        pos["entry_price"],
-                        pos["mark_price"],
-                        pos["unrealized_pnl"],
-                        pos["margin_used"]
+                        position.get("coin", ""),
+                        size,
+                        float(position.get("entryPx", 0)),
+                        float(position.get("markPx", 0)),
+                        float(position.get("unrealizedPnl", 0)),
+                        float(position.get("marginUsed", 0))
                     ])
-                
+            
+            if rows:
+                headers = ["Symbol", "Size", "Entry Price", "Mark Price", "Unrealized PnL", "Margin Used"]
                 self._print_table(headers, rows)
             else:
                 print("No open positions")
@@ -1243,16 +1121,13 @@ class ElysiumTerminalUI(cmd.Cmd):
         except Exception as e:
             print(f"\nError fetching positions: {str(e)}")
     
+    @requires_connection
     def do_history(self, arg):
         """
         Show trading history
         Usage: history [limit]
         Example: history 10
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             limit = int(arg) if arg.isdigit() else 20
             
@@ -1302,25 +1177,43 @@ class ElysiumTerminalUI(cmd.Cmd):
         """Exit on Ctrl+D"""
         return self.do_exit(arg)
     
+    def _print_scaled_results(self, result, num_orders):
+        """Print the summary message and per-order table of a scaled order result"""
+        print(f"\n{result['message']}")
+        
+        # Display order details
+        headers = ["Order #", "Size", "Price"]
+        rows = [
+            [f"{i}/{num_orders}", f"{size:.8f}", f"{price:.8f}"]
+            for i, (size, price) in enumerate(zip(result["sizes"], result["prices"]), 1)
+        ]
+        self._print_table(headers, rows)
+    
+    def _order_statuses(self, result):
+        """Return the order statuses from an exchange response, or an empty list if absent"""
+        return result.get("response", {}).get("data", {}).get("statuses", [])
+    
     def _print_table(self, headers, rows):
         """Print a formatted table to the console"""
+        # Convert every cell to text once
+        headers = [str(h) for h in headers]
+        rows = [[str(cell) for cell in row] for row in rows]
+        
         # Calculate column widths
-        col_widths = [len(str(h)) for h in headers]
+        col_widths = [len(h) for h in headers]
         for row in rows:
             for i, cell in enumerate(row):
-                col_widths[i] = max(col_widths[i], len(str(cell)))
-        
-        # Print headers
-        header_str = " | ".join(str(h).ljust(col_widths[i]) for i, h in enumerate(headers))
-        print(header_str)
-        print("-" * len(header_str))
+                col_widths[i] = max(col_widths[i], len(cell))
         
-        # Print rows
+        # Build headers and rows, then write the whole table at once
+        header_str = " | ".join(h.ljust(col_widths[i]) for i, h in enumerate(headers))
+        lines = [header_str, "-" * len(header_str)]
         for row in rows:
-            row_str = " | ".join(str(cell).ljust(col_widths[i]) for i, cell in enumerate(row))
-            print(row_str)
+            lines.append(" | ".join(cell.ljust(col_widths[i]) for i, cell in enumerate(row)))
+        print("\n".join(lines))
 
 # =======================================TWAPS==================================================
+    @requires_connection
     def do_twap_create(self, arg):
         """
         Create a new TWAP execution
@@ -1328,10 +1221,6 @@ class ElysiumTerminalUI(cmd.Cmd):
         Example: twap_create BTC buy 0.1 60 10 50000
         Example: twap_create ETH buy 0.5 30 5 3000 true 2  # Perpetual with leverage
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             args = arg.split()
             if len(args) < 5:
@@ -1340,7 +1229,7 @@ class ElysiumTerminalUI(cmd.Cmd):
                 
             symbol = args[0]
             side = args[1].lower()
-            if side not in ['buy', 'sell']:
+            if side not in self.ORDER_SIDES:
                 print("Side must be 'buy' or 'sell'")
                 return
                 
@@ -1358,7 +1247,7 @@ class ElysiumTerminalUI(cmd.Cmd):
             
             if len(args) > 6:
                 is_perp_str = args[6].lower()
-                is_perp = is_perp_str in ['true', 't', 'yes', 'y', '1']
+                is_perp = is_perp_str in self.TRUE_VALUES
             
             if len(args) > 7 and is_perp:
                 leverage = int(args[7])
@@ -1388,16 +1277,13 @@ class ElysiumTerminalUI(cmd.Cmd):
         except Exception as e:
             print(f"\nError creating TWAP: {str(e)}")
 
+    @requires_connection
     def do_twap_start(self, arg):
         """
         Start a TWAP execution
         Usage: twap_start <twap_id>
         Example: twap_start twap_20240308123045_1
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             twap_id = arg.strip()
             if not twap_id:
@@ -1416,16 +1302,13 @@ class ElysiumTerminalUI(cmd.Cmd):
         except Exception as e:
             print(f"\nError starting TWAP: {str(e)}")
 
+    @requires_connection
     def do_twap_stop(self, arg):
         """
         Stop a TWAP execution
         Usage: twap_stop <twap_id>
         Example: twap_stop twap_20240308123045_1
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             twap_id = arg.strip()
             if not twap_id:
@@ -1443,16 +1326,13 @@ class ElysiumTerminalUI(cmd.Cmd):
         except Exception as e:
             print(f"\nError stopping TWAP: {str(e)}")
 
+    @requires_connection
     def do_twap_status(self, arg):
         """
         Get the status of a TWAP execution
         Usage: twap_status <twap_id>
         Example: twap_status twap_20240308123045_1
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             twap_id = arg.strip()
             if not twap_id:
@@ -1489,63 +1369,60 @@ class ElysiumTerminalUI(cmd.Cmd):
         except Exception as e:
             print(f"\nError getting TWAP status: {str(e)}")
 
+    @requires_connection
     def do_twap_list(self, arg):
         """
         List all TWAP executions
         Usage: twap_list
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             # Get the list
             twap_list = self.order_handler.list_twaps()
             
-            # Display active TWAPs
-            print("\n=== Active TWAP Executions ===")
+            # Collect both sections and write them in one go
+            lines = ["\n=== Active TWAP Executions ==="]
             if twap_list["active"]:
                 for twap in twap_list["active"]:
-                    print(f"ID: {twap['id']}")
-                    print(f"  Symbol: {twap['symbol']}")
-                    print(f"  Side: {twap['side']}")
-                    print(f"  Type: {'Perpetual' if twap.get('is_perp', False) else 'Spot'}")
-                    print(f"  Progress: {twap['slices_executed']}/{twap['num_slices']} slices ({twap['completion_percentage']:.1f}%)")
-                    print(f"  Executed: {twap['total_executed']}/{twap['total_quantity']}")
-                    if twap['average_price'] > 0:
-                        print(f"  Avg Price: {twap['average_price']}")
-                    print()
+                    lines.extend(self._twap_summary_lines(twap, completed=False))
             else:
-                print("No active TWAP executions\n")
+                lines.append("No active TWAP executions\n")
             
-            # Display completed TWAPs
-            print("=== Completed TWAP Executions ===")
+            lines.append("=== Completed TWAP Executions ===")
             if twap_list["completed"]:
                 for twap in twap_list["completed"]:
-                    print(f"ID: {twap['id']}")
-                    print(f"  Symbol: {twap['symbol']}")
-                    print(f"  Side: {twap['side']}")
-                    print(f"  Type: {'Perpetual' if twap.get('is_perp', False) else 'Spot'}")
-                    print(f"  Completed: {twap['slices_executed']}/{twap['num_slices']} slices")
-                    print(f"  Executed: {twap['total_executed']}/{twap['total_quantity']}")
-                    if twap['average_price'] > 0:
-                        print(f"  Avg Price: {twap['average_price']}")
-                    print()
+                    lines.extend(self._twap_summary_lines(twap, completed=True))
             else:
-                print("No completed TWAP executions")
+                lines.append("No completed TWAP executions")
+            
+            print("\n".join(lines))
             
         except Exception as e:
             print(f"\nError listing TWAPs: {str(e)}")
 
+    def _twap_summary_lines(self, twap, completed):
+        """Build the twap_list entry for a single TWAP execution"""
+        lines = [
+            f"ID: {twap['id']}",
+            f"  Symbol: {twap['symbol']}",
+            f"  Side: {twap['side']}",
+            f"  Type: {'Perpetual' if twap.get('is_perp', False) else 'Spot'}"
+        ]
+        if completed:
+            lines.append(f"  Completed: {twap['slices_executed']}/{twap['num_slices']} slices")
+        else:
+            lines.append(f"  Progress: {twap['slices_executed']}/{twap['num_slices']} slices ({twap['completion_percentage']:.1f}%)")
+        lines.append(f"  Executed: {twap['total_executed']}/{twap['total_quantity']}")
+        if twap['average_price'] > 0:
+            lines.append(f"  Avg Price: {twap['average_price']}")
+        lines.append("")
+        return lines
+
+    @requires_connection
     def do_twap_stop_all(self, arg):
         """
         Stop all active TWAP executions
         Usage: twap_stop_all
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             # Stop all TWAPs
             count = self.order_handler.stop_all_twaps()
@@ -1555,15 +1432,12 @@ class ElysiumTerminalUI(cmd.Cmd):
         except Exception as e:
             print(f"\nError stopping TWAPs: {str(e)}")
 
+    @requires_connection
     def do_twap_clean(self, arg):
         """
         Clean up completed TWAP executions
         Usage: twap_clean
         """
-        if not self.api_connector.exchange:
-            print("Not connected to exchange. Use 'connect' first.")
-            return
-            
         try:
             # Clean up completed TWAPs
             count = self.order_handler.clean_completed_twaps()
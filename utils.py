@@ -1,10 +1,18 @@
 import os
 import sys
-import time
+import bisect
 import json
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Magnitude thresholds and the format used below/above each of them
+_PRICE_THRESHOLDS = (0.001, 1, 10)
+_PRICE_FORMATS = ("{:.8f}", "{:.6f}", "{:.4f}", "{:.2f}")
+_SIZE_THRESHOLDS = (0.001, 1)
+_SIZE_FORMATS = ("{:.8f}", "{:.4f}", "{:.2f}")
 
 def setup_logging(log_level: int = logging.INFO, log_file: Optional[str] = None) -> logging.Logger:
     """Set up logging configuration"""
@@ -33,23 +41,11 @@ def format_number(number: float, decimal_places: int = 2) -> str:
 
 def format_price(price: float) -> str:
     """Format a price with appropriate decimal places"""
-    if price < 0.001:
-        return f"{price:.8f}"
-    elif price < 1:
-        return f"{price:.6f}"
-    elif price < 10:
-        return f"{price:.4f}"
-    else:
-        return f"{price:.2f}"
+    return _PRICE_FORMATS[bisect.bisect_right(_PRICE_THRESHOLDS, abs(price))].format(price)
 
 def format_size(size: float) -> str:
     """Format a size with appropriate decimal places"""
-    if size < 0.001:
-        return f"{size:.8f}"
-    elif size < 1:
-        return f"{size:.4f}"
-    else:
-        return f"{size:.2f}"
+    return _SIZE_FORMATS[bisect.bisect_right(_SIZE_THRESHOLDS, abs(size))].format(size)
 
 def format_timestamp(timestamp: int) -> str:
     """Format a timestamp to date time string"""
@@ -57,26 +53,29 @@ def format_timestamp(timestamp: int) -> str:
 
 def print_table(headers: List[str], rows: List[List[Any]], title: Optional[str] = None) -> None:
     """Print a formatted table to the console"""
+    # Convert every cell to text once
+    rows = [[str(cell) for cell in row] for row in rows]
+    
     # Calculate column widths
     col_widths = [len(h) for h in headers]
     for row in rows:
         for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(str(cell)))
+            col_widths[i] = max(col_widths[i], len(cell))
     
-    # Print title if provided
+    lines = []
+    
+    # Add title if provided
     if title:
-        print(f"\n{title}")
-        print("=" * len(title))
+        lines.append(f"\n{title}")
+        lines.append("=" * len(title))
     
-    # Print headers
+    # Add headers and rows, then write the whole table at once
     header_str = " | ".join(h.ljust(col_widths[i]) for i, h in enumerate(headers))
-    print(header_str)
-    print("-" * len(header_str))
-    
-    # Print rows
+    lines.append(header_str)
+    lines.append("-" * len(header_str))
     for row in rows:
-        row_str = " | ".join(str(cell).ljust(col_widths[i]) for i, cell in enumerate(row))
-        print(row_str)
+        lines.append(" | ".join(cell.ljust(col_widths[i]) for i, cell in enumerate(row)))
+    print("\n".join(lines))
 
 def load_fills_history() -> List[Dict[str, Any]]:
     """Load trading fills history from file"""
@@ -87,7 +86,7 @@ def load_fills_history() -> List[Dict[str, Any]]:
                 for line in f:
                     fills.extend(json.loads(line.strip()))
     except Exception as e:
-        logging.error(f"Error loading fills history: {str(e)}")
+        logger.error("Error loading fills history: %s", e)
     
     return fills
 
@@ -106,19 +105,27 @@ def calculate_pnl_metrics(fills: List[Dict[str, Any]]) -> Dict[str, Any]:
         }
     
     total_trades = len(fills)
-    total_volume = sum(float(fill["sz"]) * float(fill["px"]) for fill in fills)
-    total_pnl = sum(float(fill.get("closedPnl", 0)) for fill in fills)
+    total_volume = 0.0
+    total_pnl = 0.0
+    win_count = loss_count = 0
+    win_total = loss_total = 0.0
     
-    # Separate wins and losses
-    wins = [float(fill.get("closedPnl", 0)) for fill in fills if float(fill.get("closedPnl", 0)) > 0]
-    losses = [float(fill.get("closedPnl", 0)) for fill in fills if float(fill.get("closedPnl", 0)) < 0]
+    # Accumulate volume, PnL, wins and losses in one pass, parsing each field once
+    for fill in fills:
+        total_volume += float(fill["sz"]) * float(fill["px"])
+        pnl = float(fill.get("closedPnl", 0))
+        total_pnl += pnl
+        if pnl > 0:
+            win_count += 1
+            win_total += pnl
+        elif pnl < 0:
+            loss_count += 1
+            loss_total += pnl
     
-    win_count = len(wins)
-    loss_count = len(losses)
     win_rate = (win_count / total_trades) * 100 if total_trades > 0 else 0
     
-    avg_win = sum(wins) / win_count if win_count > 0 else 0
-    avg_loss = sum(losses) / loss_count if loss_count > 0 else 0
+    avg_win = win_total / win_count if win_count > 0 else 0
+    avg_loss = loss_total / loss_count if loss_count > 0 else 0
     
     return {
         "total_trades": total_trades,